@@ -0,0 +1,26 @@
+"""Sphinx extension that loads the builder-specific extensions on demand."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+
+# Extensions that only contribute to HTML output. They are referenced by name so that importing
+# this module never imports them.
+HTML_EXTENSIONS = ("sphinx.ext.viewcode",)
+
+
+def _setup_html_extensions(app: Sphinx) -> None:
+    if app.builder.format != "html":
+        return
+    for extension in HTML_EXTENSIONS:
+        app.setup_extension(extension)
+
+
+def setup(app: Sphinx) -> dict[str, Any]:
+    """Load autodoc unconditionally and defer the HTML-only extensions until the builder is known."""
+    app.setup_extension("sphinx.ext.autodoc")
+    app.connect("builder-inited", _setup_html_extensions)
+    return {"version": "1.0", "parallel_read_safe": True, "parallel_write_safe": True}
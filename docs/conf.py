@@ -2,40 +2,20 @@
 
 # Configuration file for the Sphinx documentation builder.
 #
+# The static configuration values live in sphinx.toml and are parsed once with
+# the standard library TOML reader; only dynamic settings belong here.
+#
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-# -- Project information -----------------------------------------------------
-# https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
-
-project = "FoundryTools"
-copyright = "2024, ftCLI"
-author = "ftCLI"
-
-version = "0.1.3"
-release = "0.1.3"
-
-# -- General configuration ---------------------------------------------------
-# https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
-
-extensions = [
-    "sphinx.ext.autodoc",
-    "sphinx.ext.viewcode",
-    "sphinx.ext.todo",
-]
-
-templates_path = ["_templates"]
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
-
-language = "en"
-
-# -- Options for HTML output -------------------------------------------------
-# https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
+import sys
+import tomllib
+from pathlib import Path
 
-html_theme = "sphinx_rtd_theme"
-# html_static_path = ["_static"]
+_HERE = Path(__file__).parent
 
-# -- Options for todo extension ----------------------------------------------
-# https://www.sphinx-doc.org/en/master/usage/extensions/todo.html#configuration
+# Local extensions
+sys.path.insert(0, str(_HERE / "_ext"))
 
-todo_include_todos = True
+with (_HERE / "sphinx.toml").open("rb") as f:
+    globals().update(tomllib.load(f))
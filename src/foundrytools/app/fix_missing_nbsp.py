@@ -0,0 +1,47 @@
+"""Fix missing non-breaking space."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from foundrytools import Font
+
+SPACE = 0x0020
+NBSP = 0x00A0
+
+
+class FixMissingNbspError(Exception):
+    """Raised when an error occurs while fixing the non-breaking space of a font."""
+
+
+def run(font: Font) -> bool:
+    """
+    Fix the non-breaking space of the font, in a single pass over the ``cmap`` and ``hmtx`` tables.
+
+    If the non-breaking space is not mapped, the space glyph is double mapped to it. Otherwise, the
+    width of the non-breaking space glyph is set to the width of the space glyph. The best character
+    map is looked up once and shared by both fixes.
+
+    :param font: The ``Font`` to process.
+    :type font: Font
+    :return: ``True`` if the font was modified, ``False`` otherwise.
+    :rtype: bool
+    :raises FixMissingNbspError: If an error occurs while fixing the non-breaking space.
+    """
+    try:
+        best_cmap = font.t_cmap.best_cmap()
+        space_glyph = best_cmap.get(SPACE)
+        if space_glyph is None:
+            return False
+
+        nbsp_glyph = best_cmap.get(NBSP)
+        if nbsp_glyph is None:
+            # The space glyph is double mapped, so there is no width to fix.
+            return font.t_cmap.add_mappings({NBSP: space_glyph})
+
+        if nbsp_glyph == space_glyph:
+            return False
+        return font.t_hmtx.fix_non_breaking_space_width(best_cmap=best_cmap)
+    except Exception as e:
+        raise FixMissingNbspError(e) from e
@@ -37,7 +37,8 @@ def _get_glyph_metrics_stats(font: Font) -> dict[str, bool | int]:
     # NOTE: `range(a, b)` includes `a` and does not include `b`.
     #       Here we don't include 0-31 as well as 127
     #       because these are control characters.
-    ascii_glyph_names = [font.ttfont.getBestCmap()[c] for c in range(32, 127) if c in font.ttfont.getBestCmap()]
+    best_cmap = font.t_cmap.best_cmap()
+    ascii_glyph_names = [best_cmap[c] for c in range(32, 127) if c in best_cmap]
 
     if len(ascii_glyph_names) > 0.8 * (127 - 32):
         ascii_widths = [adv for name, (adv, lsb) in glyph_metrics.items() if name in ascii_glyph_names and adv != 0]
@@ -52,7 +53,7 @@ def _get_glyph_metrics_stats(font: Font) -> dict[str, bool | int]:
         # Add character glyphs that are in one of these categories:
         # Letter, Mark, Number, Punctuation, Symbol, Space_Separator.
         # This excludes Line_Separator, Paragraph_Separator and Control.
-        for value, name in font.ttfont.getBestCmap().items():
+        for value, name in best_cmap.items():
             if unicodedata.category(chr(value)).startswith(("L", "M", "N", "P", "S", "Zs")):
                 relevant_glyph_names.add(name)
         # Remove character glyphs that are mark glyphs.
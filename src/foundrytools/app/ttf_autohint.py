@@ -32,15 +32,19 @@ def run(font: Font) -> bool:
         raise NotImplementedError(msg)
 
     try:
+        flavor = font.ttfont.flavor
+        font.ttfont.flavor = None
+        # The binding only accepts ``bytes``. The input buffer is released before the hinted font
+        # is loaded, so that only one serialized copy of the font is alive at a time.
         with BytesIO() as buffer:
-            flavor = font.ttfont.flavor
-            font.ttfont.flavor = None
             font.save(buffer, reorder_tables=None)
-            data = ttfautohint(in_buffer=buffer.getvalue(), no_info=True)
-            hinted_font = TTFont(BytesIO(data), recalcTimestamp=False)
-            hinted_font[T_HEAD].modified = font.t_head.modified_timestamp
-            font.ttfont = hinted_font
-            font.ttfont.flavor = flavor
-            return True
+            in_buffer = buffer.getvalue()
+        data = ttfautohint(in_buffer=in_buffer, no_info=True)
+        del in_buffer
+        hinted_font = TTFont(BytesIO(data), recalcTimestamp=False)
+        hinted_font[T_HEAD].modified = font.t_head.modified_timestamp
+        font.ttfont = hinted_font
+        font.ttfont.flavor = flavor
     except Exception as e:
         raise TTFAutohintError(e) from e
+    return True
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-import contextlib
 import math
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING, Literal, TypedDict
+from typing import TYPE_CHECKING, Generic, Literal, NoReturn, TypedDict, TypeVar, overload
 
 import defcon
 from cffsubr import desubroutinize, subroutinize
@@ -21,7 +24,6 @@
 
 from foundrytools import constants as const
 from foundrytools.core.tables import (
-    TABLES_LOOKUP,
     CFFTable,
     CmapTable,
     FvarTable,
@@ -44,10 +46,13 @@
 from foundrytools.utils.path_tools import get_temp_file_path
 
 if TYPE_CHECKING:
-    from collections.abc import Generator
+    from collections.abc import Callable, Iterable, Iterator
+    from concurrent.futures import Future
     from types import TracebackType
     from typing import Any
 
+    from fontTools.ttLib.ttGlyphSet import _TTGlyphSet
+
     try:
         from typing import Self
     except ImportError:
@@ -84,6 +89,68 @@
     "canonical_order": False,
 }
 
+# Font file extensions that previous conversions may have left in a file name. WOFF2 is listed
+# before WOFF so that the alternation matches the longest extension.
+_FONT_EXTENSIONS_RE = re.compile(
+    "|".join(
+        re.escape(ext)
+        for ext in (const.OTF_EXTENSION, const.TTF_EXTENSION, const.WOFF2_EXTENSION, const.WOFF_EXTENSION)
+    )
+)
+
+
+_TableT = TypeVar("_TableT")
+
+# Marks the end of the font sources in ``Font.open_many``.
+_SENTINEL = object()
+
+
+class _TableProperty(Generic[_TableT]):
+    """
+    A read-only ``Font`` attribute returning the wrapper of a table.
+
+    The wrapper is created on first access and cached in ``Font._tables``, so a cached access is a
+    single dict lookup.
+    """
+
+    def __init__(self, table_tag: str, table_cls: Callable[[TTFont], _TableT]) -> None:
+        """
+        Initialize the descriptor.
+
+        :param table_tag: The table tag.
+        :type table_tag: str
+        :param table_cls: The table wrapper class.
+        :type table_cls: Callable[[TTFont], _TableT]
+        """
+        self.table_tag = table_tag
+        self.table_cls = table_cls
+        name = table_cls.__name__
+        self.__doc__ = (
+            f"The ``{table_tag.strip()}`` table wrapper.\n\n:return: The loaded ``{name}``.\n:rtype: {name}\n"
+        )
+
+    @overload
+    def __get__(self, instance: None, owner: type[Font]) -> Self: ...
+
+    @overload
+    def __get__(self, instance: Font, owner: type[Font]) -> _TableT: ...
+
+    def __get__(self, instance: Font | None, owner: type[Font]) -> Self | _TableT:
+        if instance is None:
+            return self
+        table = instance._tables.get(self.table_tag)  # noqa: SLF001
+        if table is None:
+            if self.table_tag not in instance.ttfont:
+                msg = f"The '{self.table_tag}' table is not present in the font"
+                raise KeyError(msg)
+            table = self.table_cls(instance.ttfont)
+            instance._tables[self.table_tag] = table  # noqa: SLF001
+        return table
+
+    def __set__(self, instance: Font, value: NoReturn) -> NoReturn:
+        msg = "Table wrappers are read-only"
+        raise AttributeError(msg)
+
 
 class FontError(Exception):
     """The ``FontError`` class is a custom exception class for font-related errors."""
@@ -123,6 +190,14 @@ class StyleFlags:
         flags.is_italic = True
     """
 
+    # Masks of the style bits in the ``OS/2.fsSelection`` and ``head.macStyle`` fields.
+    _OS2_ITALIC = 1 << 0
+    _OS2_BOLD = 1 << 5
+    _OS2_REGULAR = 1 << 6
+    _OS2_OBLIQUE = 1 << 9
+    _HEAD_BOLD = 1 << 0
+    _HEAD_ITALIC = 1 << 1
+
     def __init__(self, font: Font) -> None:
         """
         Initialize the ``Flags`` class.
@@ -133,23 +208,17 @@ def __init__(self, font: Font) -> None:
         self._font = font
 
     def __repr__(self) -> str:
-        return (
-            f"<Flags is_bold={self.is_bold}, is_italic={self.is_italic}, "
-            f"is_oblique={self.is_oblique}, is_regular={self.is_regular}>"
-        )
+        is_bold, is_italic, is_oblique, is_regular = self._snapshot()
+        return f"<Flags is_bold={is_bold}, is_italic={is_italic}, is_oblique={is_oblique}, is_regular={is_regular}>"
 
     def __str__(self) -> str:
-        return (
-            f"Flags(is_bold={self.is_bold}, is_italic={self.is_italic}, "
-            f"is_oblique={self.is_oblique}, is_regular={self.is_regular})"
-        )
+        is_bold, is_italic, is_oblique, is_regular = self._snapshot()
+        return f"Flags(is_bold={is_bold}, is_italic={is_italic}, is_oblique={is_oblique}, is_regular={is_regular})"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, StyleFlags):
             return False
-        return all(
-            getattr(self, attr) == getattr(other, attr) for attr in ("is_bold", "is_italic", "is_oblique", "is_regular")
-        )
+        return self._snapshot() == other._snapshot()
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
@@ -177,13 +246,17 @@ def font(self, value: Font) -> None:
         """
         self._font = value
 
-    @contextlib.contextmanager
-    def _update_font_properties(self) -> Generator:
-        try:
-            yield
-        except Exception as e:
-            msg = "An error occurred while updating font properties"
-            raise FontError(msg) from e
+    def _snapshot(self) -> tuple[bool, bool, bool, bool]:
+        """Read the bold, italic, oblique and regular flags with a single lookup of each table."""
+        ttfont = self.font.ttfont
+        fs_selection = ttfont[const.T_OS_2].fsSelection
+        mac_style = ttfont[const.T_HEAD].macStyle
+        return (
+            bool(fs_selection & self._OS2_BOLD and mac_style & self._HEAD_BOLD),
+            bool(fs_selection & self._OS2_ITALIC and mac_style & self._HEAD_ITALIC),
+            bool(fs_selection & self._OS2_OBLIQUE),
+            bool(fs_selection & self._OS2_REGULAR),
+        )
 
     def _set_font_style(
         self,
@@ -191,14 +264,21 @@ def _set_font_style(
         italic: bool | None = None,
         regular: bool | None = None,
     ) -> None:
+        # Bits that already have the requested value are not written again.
+        fs_selection = self.font.t_os_2.fs_selection
+        mac_style = self.font.t_head.mac_style
         if bold is not None:
-            self.font.t_os_2.fs_selection.bold = bold
-            self.font.t_head.mac_style.bold = bold
+            if fs_selection.bold != bold:
+                fs_selection.bold = bold
+            if mac_style.bold != bold:
+                mac_style.bold = bold
         if italic is not None:
-            self.font.t_os_2.fs_selection.italic = italic
-            self.font.t_head.mac_style.italic = italic
-        if regular is not None:
-            self.font.t_os_2.fs_selection.regular = regular
+            if fs_selection.italic != italic:
+                fs_selection.italic = italic
+            if mac_style.italic != italic:
+                mac_style.italic = italic
+        if regular is not None and fs_selection.regular != regular:
+            fs_selection.regular = regular
 
     @property
     def is_bold(self) -> bool:
@@ -212,17 +292,20 @@ def is_bold(self) -> bool:
 
         :return: ``True`` if the font is bold, ``False`` otherwise.
         :rtype: bool
+        :raises KeyError: If the font has no ``OS/2`` or ``head`` table.
         """
-        try:
-            return self.font.t_os_2.fs_selection.bold and self.font.t_head.mac_style.bold
-        except Exception as e:
-            msg = "An error occurred while checking if the font is bold"
-            raise FontError(msg) from e
+        ttfont = self.font.ttfont
+        return bool(
+            ttfont[const.T_OS_2].fsSelection & self._OS2_BOLD and ttfont[const.T_HEAD].macStyle & self._HEAD_BOLD
+        )
 
     @is_bold.setter
     def is_bold(self, value: bool) -> None:
-        with self._update_font_properties():
+        try:
             self._set_font_style(bold=value, regular=not value if not self.is_italic else False)
+        except Exception as e:
+            msg = "An error occurred while updating font properties"
+            raise FontError(msg) from e
 
     @property
     def is_italic(self) -> bool:
@@ -236,17 +319,20 @@ def is_italic(self) -> bool:
 
         :return: ``True`` if the font is italic, ``False`` otherwise.
         :rtype: bool
+        :raises KeyError: If the font has no ``OS/2`` or ``head`` table.
         """
-        try:
-            return self.font.t_os_2.fs_selection.italic and self.font.t_head.mac_style.italic
-        except Exception as e:
-            msg = "An error occurred while checking if the font is italic"
-            raise FontError(msg) from e
+        ttfont = self.font.ttfont
+        return bool(
+            ttfont[const.T_OS_2].fsSelection & self._OS2_ITALIC and ttfont[const.T_HEAD].macStyle & self._HEAD_ITALIC
+        )
 
     @is_italic.setter
     def is_italic(self, value: bool) -> None:
-        with self._update_font_properties():
+        try:
             self._set_font_style(italic=value, regular=not value if not self.is_bold else False)
+        except Exception as e:
+            msg = "An error occurred while updating font properties"
+            raise FontError(msg) from e
 
     @property
     def is_oblique(self) -> bool:
@@ -255,12 +341,9 @@ def is_oblique(self) -> bool:
 
         :return: ``True`` if the font is oblique, ``False`` otherwise.
         :rtype: bool
+        :raises KeyError: If the font has no ``OS/2`` table.
         """
-        try:
-            return self.font.t_os_2.fs_selection.oblique
-        except Exception as e:
-            msg = "An error occurred while checking if the font is oblique"
-            raise FontError(msg) from e
+        return bool(self.font.ttfont[const.T_OS_2].fsSelection & self._OS2_OBLIQUE)
 
     @is_oblique.setter
     def is_oblique(self, value: bool) -> None:
@@ -278,17 +361,17 @@ def is_regular(self) -> bool:
 
         :return: ``True`` if the font is regular, ``False`` otherwise.
         :rtype: bool
+        :raises KeyError: If the font has no ``OS/2`` table.
         """
-        try:
-            return self.font.t_os_2.fs_selection.regular
-        except Exception as e:
-            msg = "An error occurred while checking if the font is regular"
-            raise FontError(msg) from e
+        return bool(self.font.ttfont[const.T_OS_2].fsSelection & self._OS2_REGULAR)
 
     def set_regular(self) -> None:
         """Set the regular bit in the OS/2 table."""
-        with self._update_font_properties():
+        try:
             self._set_font_style(regular=True, bold=False, italic=False)
+        except Exception as e:
+            msg = "An error occurred while updating font properties"
+            raise FontError(msg) from e
 
 
 class Font:
@@ -298,6 +381,21 @@ class Font:
     Provides a user-friendly interface for working with font files and their data.
     """
 
+    __slots__ = (
+        "_bytesio",
+        "_file",
+        "_glyph_set",
+        "_is_ps",
+        "_is_tt",
+        "_is_variable",
+        "_resolved_file",
+        "_tables",
+        "_temp_file",
+        "_tt_opts",
+        "_ttfont",
+        "flags",
+    )
+
     def __init__(
         self,
         font_source: str | Path | BytesIO | TTFont,
@@ -305,12 +403,15 @@ def __init__(
         lazy: bool | None = None,
         recalc_bboxes: bool = True,
         recalc_timestamp: bool = False,
+        copy: bool = True,
+        resolve_path: bool = False,
     ) -> None:
         """
         Initialize a ``Font`` object.
 
         :param font_source: A path to a font file (``str`` or ``Path`` object), a ``BytesIO`` object
-            or a ``TTFont`` object.
+            or a ``TTFont`` object. A ``BytesIO`` object is kept open and exposed by the ``bytesio``
+            property; it is closed by ``close()``.
         :type font_source: Union[str, Path, BytesIO, TTFont]
         :param lazy: If ``True``, many data structures are loaded lazily, upon access only. If
             ``False``, many data structures are loaded immediately. The default is ``None``
@@ -323,98 +424,144 @@ def __init__(
         :param recalc_timestamp: If ``True``, set the ``modified`` timestamp in the ``head`` table
             on save. Defaults to ``False``.
         :type recalc_timestamp: bool
+        :param copy: Only used when ``font_source`` is a ``TTFont`` object. If ``True`` (the default),
+            the font is saved and loaded back into a new ``TTFont`` object. If ``False``, the given
+            ``TTFont`` object is used as is, avoiding a full compile and decompile of the font; in
+            this case, ``lazy``, ``recalc_bboxes`` and ``recalc_timestamp`` are ignored.
+        :type copy: bool
+        :param resolve_path: Only used when ``font_source`` is a path. If ``True``, the path is
+            resolved immediately, following symlinks. If ``False`` (the default), an absolute path is
+            used as is and a relative one is only made absolute, skipping the file system lookups
+            needed to resolve it; the resolved path is then available from ``resolved_file()``.
+        :type resolve_path: bool
         """
         self._file: Path | None = None
+        self._resolved_file: Path | None = None
         self._bytesio: BytesIO | None = None
         self._ttfont: TTFont | None = None
-        self._temp_file: Path = get_temp_file_path()
-        self._init_font(font_source, lazy, recalc_bboxes, recalc_timestamp)
-        self._init_tables()  # Ensure tables are initialized before flags
+        self._temp_file: Path | None = None
+        self._tables: dict[str, Any] = {}
+        self._glyph_set: _TTGlyphSet | None = None
+        # Keyword arguments for the ``TTFont`` constructor.
+        self._tt_opts: dict[str, Any] = {
+            "lazy": lazy,
+            "recalcBBoxes": recalc_bboxes,
+            "recalcTimestamp": recalc_timestamp,
+        }
+        self._init_font(font_source, copy, resolve_path)
+        self._probe_font_type()
         self.flags = StyleFlags(self)
 
+    @classmethod
+    def open_many(
+        cls,
+        font_sources: Iterable[str | Path | BytesIO | TTFont],
+        *,
+        workers: int = 4,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> Iterator[Font]:
+        """
+        Load multiple fonts, using a pool of threads to overlap reading and parsing the files.
+
+        The fonts are yielded in the same order as ``font_sources``. If a font cannot be loaded, the
+        exception is raised when that font is reached.
+
+        Iteration is lazy: at most ``workers * 2`` fonts are loaded ahead of the one being consumed,
+        so a large number of sources does not keep all the fonts in memory at once. If the iteration
+        stops early, the fonts loaded ahead are closed.
+
+        :param font_sources: The font sources. Each of them can be any of the types accepted by the
+            ``Font`` constructor.
+        :type font_sources: Iterable[Union[str, Path, BytesIO, TTFont]]
+        :param workers: The maximum number of threads to use. Defaults to 4.
+        :type workers: int
+        :param kwargs: Keyword arguments passed to the ``Font`` constructor for each font.
+        :return: An iterator over the loaded ``Font`` objects.
+        :rtype: Iterator[Font]
+        """
+        sources = iter(font_sources)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending: deque[Future[Font]] = deque(
+                executor.submit(cls, font_source, **kwargs) for font_source in islice(sources, workers * 2)
+            )
+            try:
+                while pending:
+                    font = pending.popleft().result()
+                    font_source = next(sources, _SENTINEL)
+                    if font_source is not _SENTINEL:
+                        pending.append(executor.submit(cls, font_source, **kwargs))
+                    yield font
+            finally:
+                # If the iteration stops early, the fonts loaded ahead are never handed over, so
+                # they are closed here.
+                for future in pending:
+                    future.cancel()
+                for future in pending:
+                    if not future.cancelled() and future.exception() is None:
+                        future.result().close()
+
     def _init_font(
         self,
         font_source: str | Path | BytesIO | TTFont,
-        lazy: bool | None,
-        recalc_bboxes: bool,  # noqa: FBT001
-        recalc_timestamp: bool,  # noqa: FBT001
+        copy: bool,  # noqa: FBT001
+        resolve_path: bool,  # noqa: FBT001
     ) -> None:
         if isinstance(font_source, (str, Path)):
-            self._init_from_file(font_source, lazy, recalc_bboxes, recalc_timestamp)
+            self._init_from_file(font_source, resolve_path)
         elif isinstance(font_source, BytesIO):
-            self._init_from_bytesio(font_source, lazy, recalc_bboxes, recalc_timestamp)
+            self._init_from_bytesio(font_source)
         elif isinstance(font_source, TTFont):
-            self._init_from_ttfont(font_source, lazy, recalc_bboxes, recalc_timestamp)
+            self._init_from_ttfont(font_source, copy)
         else:
             msg = f"Invalid source type {type(font_source)}. Expected str, Path, BytesIO, or TTFont."
             raise FontError(msg)
 
-    def _init_from_file(
-        self,
-        path: str | Path,
-        lazy: bool | None,
-        recalc_bboxes: bool,  # noqa: FBT001
-        recalc_timestamp: bool,  # noqa: FBT001
-    ) -> None:
-        self._file = Path(path).resolve()
-        self._ttfont = TTFont(path, lazy=lazy, recalcBBoxes=recalc_bboxes, recalcTimestamp=recalc_timestamp)
+    def _init_from_file(self, path: str | Path, resolve_path: bool) -> None:  # noqa: FBT001
+        file = Path(path)
+        if resolve_path:
+            self._file = self._resolved_file = file.resolve()
+        else:
+            self._file = file if file.is_absolute() else file.absolute()
+        self._ttfont = TTFont(path, **self._tt_opts)
 
-    def _init_from_bytesio(
-        self,
-        bytesio: BytesIO,
-        lazy: bool | None,
-        recalc_bboxes: bool,  # noqa: FBT001
-        recalc_timestamp: bool,  # noqa: FBT001
-    ) -> None:
+    def _init_from_bytesio(self, bytesio: BytesIO) -> None:
         self._bytesio = bytesio
-        self._ttfont = TTFont(bytesio, lazy=lazy, recalcBBoxes=recalc_bboxes, recalcTimestamp=recalc_timestamp)
-        bytesio.close()
+        # The stream is left open: with ``lazy=True`` the tables are read from it on access.
+        self._ttfont = TTFont(bytesio, **self._tt_opts)
 
-    def _init_from_ttfont(
-        self,
-        ttfont: TTFont,
-        lazy: bool | None,
-        recalc_bboxes: bool,  # noqa: FBT001
-        recalc_timestamp: bool,  # noqa: FBT001
-    ) -> None:
+    def _init_from_ttfont(self, ttfont: TTFont, copy: bool) -> None:  # noqa: FBT001
+        if not copy:
+            self._ttfont = ttfont
+            return
         self._bytesio = BytesIO()
         ttfont.save(self._bytesio, reorderTables=False)
         self._bytesio.seek(0)
-        self._ttfont = TTFont(self._bytesio, lazy=lazy, recalcBBoxes=recalc_bboxes, recalcTimestamp=recalc_timestamp)
-
-    def _init_tables(self) -> None:
-        """
-        Initialize all font table attributes to None.
-
-        This method sets up the initial state for each table in the font,
-        ensuring that they are ready to be loaded when accessed.
-        """
-        self._cff: CFFTable | None = None
-        self._cmap: CmapTable | None = None
-        self._fvar: FvarTable | None = None
-        self._gdef: GdefTable | None = None
-        self._glyf: GlyfTable | None = None
-        self._gsub: GsubTable | None = None
-        self._head: HeadTable | None = None
-        self._hhea: HheaTable | None = None
-        self._hmtx: HmtxTable | None = None
-        self._kern: KernTable | None = None
-        self._name: NameTable | None = None
-        self._os_2: OS2Table | None = None
-        self._post: PostTable | None = None
-
-    def _get_table(self, table_tag: str) -> Any:  # noqa: ANN401
-        table_attr, table_cls = TABLES_LOOKUP[table_tag]
-        if getattr(self, table_attr) is None:
-            if self.ttfont.get(table_tag) is None:
-                msg = f"The '{table_tag}' table is not present in the font"
-                raise KeyError(msg)
-            setattr(self, table_attr, table_cls(self.ttfont))
-        table = getattr(self, table_attr)
-        if table is None:
-            msg = f"An error occurred while loading the '{table_tag}' table"
-            raise KeyError(msg)
-        return table
+        self._ttfont = TTFont(self._bytesio, **self._tt_opts)
+
+    def _probe_font_type(self) -> None:
+        # The outlines type and whether the font has a ``fvar`` table are checked once here, when
+        # the font is loaded, reloaded or its ``TTFont`` is replaced, and after converting the outlines.
+        sfnt_version = self.ttfont.sfntVersion
+        self._is_ps = sfnt_version == const.PS_SFNT_VERSION
+        self._is_tt = sfnt_version == const.TT_SFNT_VERSION
+        self._is_variable = const.T_FVAR in self.ttfont
+
+    def _reset_caches(self) -> None:
+        # Everything derived from the ``TTFont`` object is dropped when it is replaced: the table
+        # wrappers, the glyph set, the outline flags and the style flags.
+        self._tables.clear()
+        self._glyph_set = None
+        self._probe_font_type()
+        self.flags = StyleFlags(self)
+
+    def _clear_glyph_caches(self) -> None:
+        # Called by the methods that change the glyphs in place. The table wrappers are kept, so
+        # that they can still tell whether their table was modified, but the data that the ``cmap``
+        # wrapper caches from the character map may no longer be valid.
+        self._glyph_set = None
+        cmap = self._tables.get(const.T_CMAP)
+        if cmap is not None:
+            cmap._clear_caches()  # noqa: SLF001
 
     def __enter__(self) -> Self:
         """Enter context manager."""
@@ -458,6 +605,22 @@ def file(self, value: str | Path) -> None:
         if isinstance(value, str):
             value = Path(value)
         self._file = value
+        self._resolved_file = None
+
+    def resolved_file(self) -> Path | None:
+        """
+        Get the resolved file path of the font, following symlinks.
+
+        The ``file`` property is not resolved unless ``resolve_path=True`` was passed when loading
+        the font, which is enough to get the parent directory or the stem of the file name. The path
+        is resolved the first time this method is called, and the result is cached.
+
+        :return: The resolved file path of the font, or ``None`` if the font has no file path.
+        :rtype: Optional[Path]
+        """
+        if self._resolved_file is None and self._file is not None:
+            self._resolved_file = self._file.resolve()
+        return self._resolved_file
 
     @property
     def bytesio(self) -> BytesIO | None:
@@ -502,146 +665,51 @@ def ttfont(self, value: TTFont) -> None:
 
         """
         self._ttfont = value
+        self._reset_caches()
 
     @property
     def temp_file(self) -> Path:
         """
         A placeholder for the temporary file path of the font, in case is needed for some operations.
 
+        The temporary file is created the first time this property is accessed.
+
         :return: The temporary file path of the font.
         :rtype: Path
         """
+        if self._temp_file is None:
+            self._temp_file = get_temp_file_path()
         return self._temp_file
 
-    @property
-    def t_cff_(self) -> CFFTable:
-        """
-        The ``CFF`` table wrapper.
-
-        :return: The loaded ``CFFTable``.
-        :rtype: CFFTable
-        """
-        return self._get_table(const.T_CFF)
-
-    @property
-    def t_cmap(self) -> CmapTable:
-        """
-        The ``cmap`` table wrapper.
-
-        :return: The loaded ``CmapTable``.
-        :rtype: CmapTable
-        """
-        return self._get_table(const.T_CMAP)
-
-    @property
-    def t_fvar(self) -> FvarTable:
-        """
-        The ``fvar`` table wrapper.
-
-        :return: The loaded ``FvarTable``.
-        :rtype: FvarTable
-        """
-        return self._get_table(const.T_FVAR)
-
-    @property
-    def t_gdef(self) -> GdefTable:
-        """
-        The ``GDEF`` table wrapper.
-
-        :return: The loaded ``GdefTable``.
-        :rtype: GdefTable
-        """
-        return self._get_table(const.T_GDEF)
-
-    @property
-    def t_glyf(self) -> GlyfTable:
-        """
-        The ``glyf`` table wrapper.
-
-        :return: The loaded ``GlyfTable``.
-        :rtype: GlyfTable
-        """
-        return self._get_table(const.T_GLYF)
-
-    @property
-    def t_gsub(self) -> GsubTable:
-        """
-        The ``GSUB`` table wrapper.
-
-        :return: The loaded ``GsubTable``.
-        :rtype: GsubTable
-        """
-        return self._get_table(const.T_GSUB)
-
-    @property
-    def t_head(self) -> HeadTable:
-        """
-        The ``head`` table wrapper.
-
-        :return: The loaded ``HeadTable``.
-        :rtype: HeadTable
-        """
-        return self._get_table(const.T_HEAD)
-
-    @property
-    def t_hhea(self) -> HheaTable:
-        """
-        The ``hhea`` table wrapper.
-
-        :return: The loaded ``HheaTable``.
-        :rtype: HheaTable
-        """
-        return self._get_table(const.T_HHEA)
-
-    @property
-    def t_hmtx(self) -> HmtxTable:
-        """
-        The ``hmtx`` table wrapper.
-
-        :return: The loaded ``HmtxTable``.
-        :rtype: HmtxTable
-        """
-        return self._get_table(const.T_HMTX)
+    t_cff_ = _TableProperty(const.T_CFF, CFFTable)
+    t_cmap = _TableProperty(const.T_CMAP, CmapTable)
+    t_fvar = _TableProperty(const.T_FVAR, FvarTable)
+    t_gdef = _TableProperty(const.T_GDEF, GdefTable)
+    t_glyf = _TableProperty(const.T_GLYF, GlyfTable)
+    t_gsub = _TableProperty(const.T_GSUB, GsubTable)
+    t_head = _TableProperty(const.T_HEAD, HeadTable)
+    t_hhea = _TableProperty(const.T_HHEA, HheaTable)
+    t_hmtx = _TableProperty(const.T_HMTX, HmtxTable)
+    t_kern = _TableProperty(const.T_KERN, KernTable)
+    t_name = _TableProperty(const.T_NAME, NameTable)
+    t_os_2 = _TableProperty(const.T_OS_2, OS2Table)
+    t_post = _TableProperty(const.T_POST, PostTable)
 
     @property
-    def t_kern(self) -> KernTable:
+    def glyph_set(self) -> _TTGlyphSet:
         """
-        The ``kern`` table wrapper.
+        A read-only property for the glyph set of the font.
 
-        :return: The loaded ``KernTable``.
-        :rtype: KernTable
-        """
-        return self._get_table(const.T_KERN)
-
-    @property
-    def t_name(self) -> NameTable:
-        """
-        The ``name`` table wrapper.
+        The glyph set is created on first access and cached. It is dropped by the methods of this
+        class that change the glyphs, and when the ``ttfont`` attribute is replaced or the font is
+        reloaded.
 
-        :return: The loaded ``NameTable``.
-        :rtype: NameTable
+        :return: The glyph set of the font.
+        :rtype: _TTGlyphSet
         """
-        return self._get_table(const.T_NAME)
-
-    @property
-    def t_os_2(self) -> OS2Table:
-        """
-        The ``OS/2`` table wrapper.
-
-        :return: The loaded ``OS2Table``.
-        :rtype: OS2Table
-        """
-        return self._get_table(const.T_OS_2)
-
-    @property
-    def t_post(self) -> PostTable:
-        """
-        The ``post`` table wrapper.
-
-        :return: The loaded ``PostTable``.
-        :rtype: PostTable
-        """
-        return self._get_table(const.T_POST)
+        if self._glyph_set is None:
+            self._glyph_set = self.ttfont.getGlyphSet()
+        return self._glyph_set
 
     @property
     def is_ps(self) -> bool:
@@ -649,11 +717,13 @@ def is_ps(self) -> bool:
         A read-only property for checking if the font has PostScript outlines.
 
         The font has PostScript outlines if the ``sfntVersion`` attribute of the ``TTFont`` object is ``OTTO``.
+        The check is done when the font is loaded or the ``ttfont`` attribute is replaced, again by
+        :meth:`reload` and :meth:`rebuild`, and after converting the outlines.
 
         :return: ``True`` if the font sfntVersion is ``OTTO``, ``False`` otherwise.
         :rtype: bool
         """
-        return self.ttfont.sfntVersion == const.PS_SFNT_VERSION
+        return self._is_ps
 
     @property
     def is_tt(self) -> bool:
@@ -661,11 +731,13 @@ def is_tt(self) -> bool:
         A read-only property for checking if the font has TrueType outlines.
 
         The font has TrueType outlines if the ``sfntVersion`` attribute of the ``TTFont`` object is ``\0\1\0\0``.
+        The check is done when the font is loaded or the ``ttfont`` attribute is replaced, again by
+        :meth:`reload` and :meth:`rebuild`, and after converting the outlines.
 
         :return: ``True`` if the font sfntVersion is ``\0\1\0\0``, ``False`` otherwise.
         :rtype: bool
         """
-        return self.ttfont.sfntVersion == const.TT_SFNT_VERSION
+        return self._is_tt
 
     @property
     def is_woff(self) -> bool:
@@ -709,11 +781,13 @@ def is_static(self) -> bool:
         A read-only property for checking if the font is a static font.
 
         The font is a static font if the ``TTFont`` object does not have a ``fvar`` table.
+        The check is done when the font is loaded or the ``ttfont`` attribute is replaced, and again
+        by :meth:`reload`, :meth:`rebuild` and :meth:`del_table`.
 
         :return: ``True`` if the font does not have a ``fvar`` table, ``False`` otherwise.
         :rtype: bool
         """
-        return self.ttfont.get(const.T_FVAR) is None
+        return not self._is_variable
 
     @property
     def is_variable(self) -> bool:
@@ -721,26 +795,29 @@ def is_variable(self) -> bool:
         A read-only property for checking if the font is a variable font.
 
         The font is a variable font if the ``TTFont`` object has a ``fvar`` table.
+        The check is done when the font is loaded or the ``ttfont`` attribute is replaced, and again
+        by :meth:`reload`, :meth:`rebuild` and :meth:`del_table`.
 
         :return: ``True`` if the font has a ``fvar`` table, ``False`` otherwise.
         :rtype: bool
         """
-        return self.ttfont.get(const.T_FVAR) is not None
+        return self._is_variable
 
     def save(
         self,
         file: str | Path | BytesIO,
         *,
-        reorder_tables: bool | None = True,
+        reorder_tables: bool | None = None,
     ) -> None:
         """
         Save the font to a file.
 
         :param file: The file path or ``BytesIO`` object to save the font to.
         :type file: Union[str, Path, BytesIO]
-        :param reorder_tables: If ``True`` (the default), reorder the tables, sorting them by tag
-            (recommended by the OpenType specification). If ``False``, retain the original order.
-            If ``None``, reorder by table dependency (fastest).
+        :param reorder_tables: If ``None`` (the default), reorder by table dependency (fastest). If
+            ``True``, reorder the tables, sorting them by tag (recommended by the OpenType
+            specification); this needs an extra pass over the whole font, so use it for final output
+            rather than for intermediate files. If ``False``, retain the original order.
         :type reorder_tables: Optional[bool]
         """
         self.ttfont.save(file, reorderTables=reorder_tables)
@@ -748,20 +825,33 @@ def save(
     def close(self) -> None:
         """Close the font and delete the temporary file."""
         self.ttfont.close()
-        self._temp_file.unlink(missing_ok=True)
+        if self._temp_file is not None:
+            self._temp_file.unlink(missing_ok=True)
         if self.bytesio:
             self.bytesio.close()
 
-    def reload(self) -> None:
-        """Reload the font by saving it to a temporary stream and then loading it back."""
+    def reload(self, *, force_recompile: bool = False) -> None:
+        """
+        Reload the font, discarding the cached table wrappers.
+
+        By default, only the table wrappers are dropped, so that they are created again from the
+        current ``TTFont`` object the next time they are accessed. This is what is needed after
+        replacing the ``ttfont`` attribute.
+
+        :param force_recompile: If ``True``, also save the font to a temporary stream and load it
+            back, so that all the tables are compiled and decompiled again. Defaults to ``False``.
+        :type force_recompile: bool
+        """
+        if not force_recompile:
+            self._reset_caches()
+            return
+
         recalc_bboxes = self.ttfont.recalcBBoxes
         recalc_timestamp = self.ttfont.recalcTimestamp
         buf = BytesIO()
-        self.ttfont.save(buf)
+        self.ttfont.save(buf, reorderTables=None)
         buf.seek(0)
         self.ttfont = TTFont(buf, recalcBBoxes=recalc_bboxes, recalcTimestamp=recalc_timestamp)
-        self._init_tables()
-        self.flags = StyleFlags(self)
         buf.close()
 
     def rebuild(self) -> None:
@@ -773,8 +863,7 @@ def rebuild(self) -> None:
         buf.seek(0)
         self.ttfont = TTFont(recalcBBoxes=recalc_bboxes, recalcTimestamp=recalc_timestamp)
         self.ttfont.importXML(buf)
-        self._init_tables()
-        self.flags = StyleFlags(self)
+        self._reset_caches()
         buf.close()
 
     def get_file_ext(self) -> str:
@@ -786,13 +875,16 @@ def get_file_ext(self) -> str:
         """
         # Order of if statements is important.
         # WOFF and WOFF2 must be checked before OTF and TTF.
-        if self.is_woff:
+        ttfont = self.ttfont
+        flavor = ttfont.flavor
+        if flavor == const.WOFF_FLAVOR:
             return const.WOFF_EXTENSION
-        if self.is_woff2:
+        if flavor == const.WOFF2_FLAVOR:
             return const.WOFF2_EXTENSION
-        if self.is_ps:
+        sfnt_version = ttfont.sfntVersion
+        if sfnt_version == const.PS_SFNT_VERSION:
             return const.OTF_EXTENSION
-        if self.is_tt:
+        if sfnt_version == const.TT_SFNT_VERSION:
             return const.TTF_EXTENSION
         msg = "Unknown font type."
         raise ValueError(msg)
@@ -843,20 +935,14 @@ def get_file_path(
 
         out_dir = output_dir or file.parent
         extension = extension or self.get_file_ext()
-        file_name = file.stem + extension
+        file_name = f"{file.stem}{extension}"
 
         # Clean up the file name by removing the extensions used as file name suffix as added by
         # possible previous conversions. This is necessary to avoid adding the suffix multiple
         # times, like in the case of a file name like 'font.woff2.ttf.woff2'. It may happen when
         # converting a WOFF2 font to TTF and then to WOFF2 again.
         if suffix != "":
-            for ext in [
-                const.OTF_EXTENSION,
-                const.TTF_EXTENSION,
-                const.WOFF2_EXTENSION,
-                const.WOFF_EXTENSION,
-            ]:
-                file_name = file_name.replace(ext, "")
+            file_name = _FONT_EXTENSIONS_RE.sub("", file_name)
 
         return Path(
             makeOutputFileName(
@@ -913,6 +999,8 @@ def to_ttf(self, *, max_err: float = 1.0, reverse_direction: bool = True) -> Non
             raise FontConversionError(msg)
 
         build_ttf(font=self.ttfont, max_err=max_err, reverse_direction=reverse_direction)
+        self._clear_glyph_caches()
+        self._probe_font_type()
 
     def to_otf(self, *, tolerance: float = 1.0, correct_contours: bool = True) -> None:
         """
@@ -933,10 +1021,13 @@ def to_otf(self, *, tolerance: float = 1.0, correct_contours: bool = True) -> No
         if self.is_variable:
             msg = "Conversion to PostScript is not supported for variable fonts."
             raise FontConversionError(msg)
-        self.t_glyf.decompose_all()
+        if self.t_glyf.has_composites:
+            self.t_glyf.decompose_all()
 
         charstrings = quadratics_to_cubics(font=self.ttfont, tolerance=tolerance, correct_contours=correct_contours)
         build_otf(font=self.ttfont, charstrings_dict=charstrings)
+        self._clear_glyph_caches()
+        self._probe_font_type()
 
         self.t_os_2.recalc_avg_char_width()
 
@@ -962,15 +1053,16 @@ def calc_italic_angle(self, min_slant: float = 2.0) -> float:
         :raises FontError: If the font does not contain the glyph 'H' or 'uni0048' or if an error
             occurs while calculating the italic angle.
         """
-        glyph_set = self.ttfont.getGlyphSet()
+        glyph_set = self.glyph_set
         pen = StatisticsPen(glyphset=glyph_set)
         for g in ("H", "uni0048"):
-            with contextlib.suppress(KeyError):
-                glyph_set[g].draw(pen)
-                italic_angle = -1 * math.degrees(math.atan(pen.slant))
-                if abs(italic_angle) >= abs(min_slant):
-                    return italic_angle
-                return 0.0
+            if g not in glyph_set:
+                continue
+            glyph_set[g].draw(pen)
+            italic_angle = -1 * math.degrees(math.atan(pen.slant))
+            if abs(italic_angle) >= abs(min_slant):
+                return italic_angle
+            return 0.0
         msg = "The font does not contain the glyph 'H' or 'uni0048'."
         raise FontError(msg)
 
@@ -983,7 +1075,7 @@ def get_glyph_bounds(self, glyph_name: str) -> GlyphBounds:
         :return: The bounding box of the glyph.
         :rtype: dict[str, float]
         """
-        glyph_set = self.ttfont.getGlyphSet()
+        glyph_set = self.glyph_set
 
         if glyph_name not in glyph_set:
             msg = f"Glyph '{glyph_name}' does not exist in the font."
@@ -1029,6 +1121,7 @@ def scale_upm(self, target_upm: int) -> None:
             return
 
         scale_upem(self.ttfont, new_upem=target_upm)
+        self._clear_glyph_caches()
 
     def correct_contours(
         self,
@@ -1071,6 +1164,7 @@ def correct_contours(
             msg = "Contour correction is not supported for variable fonts."
             raise NotImplementedError(msg)
 
+        self._clear_glyph_caches()
         if self.is_ps:
             return self.t_cff_.correct_contours(
                 remove_hinting=remove_hinting,
@@ -1127,6 +1221,7 @@ def remove_glyphs(
         subsetter = Subsetter(options=options)
         subsetter.populate(glyphs=remaining_glyphs)
         subsetter.subset(self.ttfont)
+        self._clear_glyph_caches()
 
         new_glyph_order = self.ttfont.getGlyphOrder()
         return set(old_glyph_order).difference(new_glyph_order)
@@ -1145,6 +1240,7 @@ def remove_unused_glyphs(self) -> set[str]:
         subsetter = Subsetter(options=options)
         subsetter.populate(unicodes=unicodes)
         subsetter.subset(self.ttfont)
+        self._clear_glyph_caches()
         new_glyph_order = self.ttfont.getGlyphOrder()
 
         return set(old_glyph_order) - set(new_glyph_order)
@@ -1179,6 +1275,7 @@ def rename_glyph(self, old_name: str, new_name: str) -> bool:
 
         rename_map = dict(zip(old_glyph_order, new_glyph_order))
         PostProcessor.rename_glyphs(otf=self.ttfont, rename_map=rename_map)
+        self._clear_glyph_caches()
         self.t_cmap.rebuild_character_map(remap_all=True)
 
         return new_glyph_order != old_glyph_order
@@ -1197,6 +1294,7 @@ def rename_glyphs(self, new_glyph_order: list[str]) -> bool:
             return False
         rename_map = dict(zip(old_glyph_order, new_glyph_order))
         PostProcessor.rename_glyphs(otf=self.ttfont, rename_map=rename_map)
+        self._clear_glyph_caches()
         self.t_cmap.rebuild_character_map(remap_all=True)
 
         return True
@@ -1237,6 +1335,7 @@ def set_production_names(self) -> list[tuple[str, str]]:
 
         rename_map = dict(zip(old_glyph_order, new_glyph_order))
         PostProcessor.rename_glyphs(otf=self.ttfont, rename_map=rename_map)
+        self._clear_glyph_caches()
         self.t_cmap.rebuild_character_map(remap_all=True)
 
         return renamed_glyphs
@@ -1271,6 +1370,7 @@ def sort_glyphs(self, sort_by: Literal["unicode", "alphabetical", "cannedDesign"
             return False
 
         self.ttfont.reorderGlyphs(new_glyph_order=new_glyph_order)
+        self._clear_glyph_caches()
 
         return True
 
@@ -1291,6 +1391,7 @@ def subroutinize(self) -> bool:
 
         with restore_flavor(self.ttfont):
             subroutinize(self.ttfont)
+            self._clear_glyph_caches()
             return True
 
     def desubroutinize(self) -> bool:
@@ -1309,6 +1410,7 @@ def desubroutinize(self) -> bool:
 
         with restore_flavor(self.ttfont):
             desubroutinize(self.ttfont)
+            self._clear_glyph_caches()
             return True
 
     def del_table(self, table_tag: str) -> bool:
@@ -1322,4 +1424,7 @@ def del_table(self, table_tag: str) -> bool:
             return False
 
         self.ttfont.reader.tables.pop(table_tag, None)
+        self._clear_glyph_caches()
+        # A table that was already decompiled is still in the font, so check again.
+        self._probe_font_type()
         return True
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from foundrytools.constants import T_CMAP
@@ -17,6 +16,19 @@
     from fontTools.ttLib import TTFont
     from fontTools.ttLib.tables._c_m_a_p import table__c_m_a_p
 
+# The highest codepoint that each subtable format can store. Format 14 (Unicode Variation
+# Sequences) does not map single codepoints and is not listed.
+_MAX_CODEPOINTS = {
+    0: 0xFF,
+    2: 0xFFFF,
+    4: 0xFFFF,
+    6: 0xFFFF,
+    8: 0x10FFFF,
+    10: 0x10FFFF,
+    12: 0x10FFFF,
+    13: 0x10FFFF,
+}
+
 
 class CmapTable(DefaultTbl):  # pylint: disable=too-few-public-methods
     """Extend the fontTools ``cmap`` table."""
@@ -29,17 +41,28 @@ def __init__(self, ttfont: TTFont) -> None:
         :type ttfont: TTFont
         """
         super().__init__(ttfont=ttfont, table_tag=T_CMAP)
-        self._copy = deepcopy(self.table)
+        # The original table compiled to bytes. It is taken here, so that changes made through
+        # the ``TTFont`` object or by fontTools helpers are detected too.
+        self._original_bytes: bytes = self._table.compile(self.ttfont)
+        self._best_cmap: dict[int, str] | None = None
+        self._mapped_glyph_names: frozenset[str] | None = None
 
     @property
     def table(self) -> table__c_m_a_p:
-        """The wrapped ``table__c_m_a_p`` table object."""
+        """
+        The wrapped ``table__c_m_a_p`` table object.
+
+        The table can be modified through the returned object, so the cached character map data
+        is dropped. The read-only methods of this class use ``_table`` instead.
+        """
+        self._clear_caches()
         return self._table
 
     @table.setter
     def table(self, value: table__c_m_a_p) -> None:
         """Wrap a new ``table__c_m_a_p`` object."""
         self._table = value
+        self._clear_caches()
 
     @property
     def is_modified(self) -> bool:
@@ -49,7 +72,42 @@ def is_modified(self) -> bool:
         :return: Whether the ``cmap`` table has been modified.
         :rtype: bool
         """
-        return self._copy.compile(self.ttfont) != self.table.compile(self.ttfont)
+        return self._table.compile(self.ttfont) != self._original_bytes
+
+    def _clear_caches(self) -> None:
+        """Drop the data cached from the character map, after it has been changed."""
+        self._best_cmap = None
+        self._mapped_glyph_names = None
+
+    def best_cmap(self) -> dict[int, str]:
+        """
+        Return the best Unicode character map of the ``cmap`` table.
+
+        The result of ``table__c_m_a_p.getBestCmap()`` is cached until the character map is changed
+        by this class, the table is accessed through ``table``, or the glyphs are changed by the
+        ``Font`` methods. The returned dictionary must not be modified.
+
+        :return: A dictionary mapping codepoints to glyph names.
+        :rtype: dict[int, str]
+        """
+        if self._best_cmap is None:
+            self._best_cmap = self._table.getBestCmap() or {}
+        return self._best_cmap
+
+    def get_mapped_glyph_names(self) -> frozenset[str]:
+        """
+        Return the names of the glyphs mapped by any of the ``cmap`` subtables.
+
+        The result is cached on the same terms as ``best_cmap()``.
+
+        :return: A frozenset of glyph names.
+        :rtype: frozenset[str]
+        """
+        if self._mapped_glyph_names is None:
+            self._mapped_glyph_names = frozenset(
+                glyph_name for table in self._table.tables for glyph_name in table.cmap.values()
+            )
+        return self._mapped_glyph_names
 
     def get_all_codepoints(self) -> set[int]:
         """
@@ -58,11 +116,7 @@ def get_all_codepoints(self) -> set[int]:
         :return: A set of codepoints
         :rtype: set[int]
         """
-        codepoints = set()
-        for table in self.table.tables:
-            if table.isUnicode():
-                codepoints.update(table.cmap.keys())
-        return codepoints
+        return set().union(*(table.cmap.keys() for table in self._table.tables if table.isUnicode()))
 
     def get_unmapped_glyphs(self) -> list[str]:
         """
@@ -72,7 +126,7 @@ def get_unmapped_glyphs(self) -> list[str]:
         :rtype: set[str]
         """
         glyph_order = self.ttfont.getGlyphOrder()
-        reversed_cmap = self.table.buildReversed()
+        reversed_cmap = self._table.buildReversed()
         return [name for name in glyph_order if reversed_cmap.get(name) is None]
 
     def rebuild_character_map(
@@ -91,7 +145,7 @@ def rebuild_character_map(
         unmapped = self.get_unmapped_glyphs()
 
         if not remap_all:
-            target_cmap = self.table.getBestCmap()
+            target_cmap = dict(self.best_cmap())
             source_cmap = cmap_from_glyph_names(glyphs_list=unmapped)
         else:
             target_cmap = {}
@@ -99,23 +153,63 @@ def rebuild_character_map(
 
         updated_cmap, remapped, duplicates = update_character_map(source_cmap=source_cmap, target_cmap=target_cmap)
         setup_character_map(ttfont=self.ttfont, mapping=updated_cmap)
+        # ``setup_character_map`` replaces the ``cmap`` table of the font.
+        self.table = self.ttfont[T_CMAP]
 
         return remapped, duplicates
 
-    def add_missing_nbsp(self) -> None:
-        """Fix the missing non-breaking space glyph by double mapping the space glyph."""
+    def add_missing_nbsp(self) -> bool:
+        """
+        Fix the missing non-breaking space glyph by double mapping the space glyph.
+
+        :return: ``True`` if the non-breaking space was mapped, ``False`` otherwise.
+        :rtype: bool
+        """
         # Get the space glyph
-        best_cmap = self.table.getBestCmap()
+        best_cmap = self.best_cmap()
         space_glyph = best_cmap.get(0x0020)
         if space_glyph is None:
-            return
+            return False
 
         # Get the non-breaking space glyph
         nbsp_glyph = best_cmap.get(0x00A0)
         if nbsp_glyph is not None:
-            return
+            return False
 
         # Copy the space glyph to the non-breaking space glyph
+        return self.add_mappings({0x00A0: space_glyph})
+
+    def add_mappings(self, mapping: dict[int, str], *, only_missing: bool = True) -> bool:
+        """
+        Add codepoint to glyph name mappings to all the Unicode subtables, in a single pass.
+
+        Codepoints are only added to the subtables that can store them: up to U+00FF for format 0,
+        up to U+FFFF for formats 2, 4 and 6, and any codepoint for formats 8, 10, 12 and 13. Unicode
+        Variation Sequences subtables (format 14) are skipped.
+
+        :param mapping: A dictionary mapping codepoints to glyph names.
+        :type mapping: dict[int, str]
+        :param only_missing: If ``True`` (the default), codepoints already mapped in a subtable are
+            not remapped. If ``False``, they are overwritten.
+        :type only_missing: bool
+        :return: ``True`` if any subtable was modified, ``False`` otherwise.
+        :rtype: bool
+        """
+        modified = False
         for table in self.table.tables:
-            if table.isUnicode():
-                table.cmap[0x00A0] = space_glyph
+            max_codepoint = _MAX_CODEPOINTS.get(table.format)
+            if max_codepoint is None or not table.isUnicode():
+                continue
+            cmap = table.cmap
+            new_mappings = {
+                codepoint: glyph_name
+                for codepoint, glyph_name in mapping.items()
+                if codepoint <= max_codepoint and not (only_missing and codepoint in cmap)
+            }
+            if new_mappings:
+                cmap.update(new_mappings)
+                modified = True
+
+        if modified:
+            self._clear_caches()
+        return modified
@@ -35,7 +35,9 @@ def __init__(self, ttfont: TTFont, table_tag: str) -> None:
             msg = f"Table {table_tag} not found in font"
             raise KeyError(msg)
         self._ttfont: TTFont = ttfont
-        self._table: T = ttfont.get(table_tag)
+        self._table_tag = table_tag
+        # The table is decompiled the first time it is accessed, not when the wrapper is created.
+        self._loaded_table: T | None = None
 
     @property
     def ttfont(self) -> TTFont:
@@ -47,6 +49,17 @@ def ttfont(self) -> TTFont:
         """
         return self._ttfont
 
+    @property
+    def _table(self) -> T:
+        """The wrapped table object, loaded from the ``TTFont`` object on first access."""
+        if self._loaded_table is None:
+            self._loaded_table = self._ttfont[self._table_tag]
+        return self._loaded_table
+
+    @_table.setter
+    def _table(self, value: T) -> None:
+        self._loaded_table = value
+
     @property
     def table(self) -> T:
         """The wrapped table object."""
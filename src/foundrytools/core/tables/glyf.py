@@ -14,6 +14,7 @@
 if TYPE_CHECKING:
     from fontTools.ttLib import TTFont
     from fontTools.ttLib.tables._g_l_y_f import table__g_l_y_f
+    from fontTools.ttLib.ttGlyphSet import _TTGlyphSet
 
 
 class GlyfTable(DefaultTbl):
@@ -68,7 +69,9 @@ def decompose_glyph(self, glyph_name: str) -> None:
         :param glyph_name: The name of the glyph to decompose.
         :type glyph_name: str
         """
-        glyph_set = self.ttfont.getGlyphSet()
+        self._decompose_glyph(glyph_name, self.ttfont.getGlyphSet())
+
+    def _decompose_glyph(self, glyph_name: str, glyph_set: _TTGlyphSet) -> None:
         dc_pen = DecomposingRecordingPen(glyph_set)
         glyph_set[glyph_name].draw(dc_pen)
 
@@ -76,6 +79,18 @@ def decompose_glyph(self, glyph_name: str) -> None:
         dc_pen.replay(tt_pen)
         self.table[glyph_name] = tt_pen.glyph()
 
+    @property
+    def has_composites(self) -> bool:
+        """
+        A read-only property for checking if the ``glyf`` table contains composite glyphs.
+
+        :return: ``True`` if at least one glyph is a composite glyph, ``False`` otherwise.
+        :rtype: bool
+        """
+        # Read the glyphs without ``table__g_l_y_f.__getitem__``, which would expand them: the
+        # composite flag of an unexpanded glyph is read from the header of its raw data.
+        return any(glyph.isComposite() for glyph in self.table.glyphs.values())
+
     def decompose_all(self) -> set[str]:
         """
         Decompose all composite glyphs.
@@ -84,11 +99,14 @@ def decompose_all(self) -> set[str]:
         :rtype: set[str]
         """
         decomposed_glyphs = set()
+        # The glyph set reads the glyphs from the table on access, so a single one can be used for
+        # all the glyphs, including those whose components have already been decomposed.
+        glyph_set = self.ttfont.getGlyphSet()
         for glyph_name in self.ttfont.getGlyphOrder():
             glyph = self.table[glyph_name]
             if not glyph.isComposite():
                 continue
-            self.decompose_glyph(glyph_name)
+            self._decompose_glyph(glyph_name, glyph_set)
             decomposed_glyphs.add(glyph_name)
 
         return decomposed_glyphs
@@ -34,13 +34,17 @@ def table(self, value: table__h_m_t_x) -> None:
         """Wrap a new ``table__h_m_t_x`` object."""
         self._table = value
 
-    def fix_non_breaking_space_width(self) -> bool:
+    def fix_non_breaking_space_width(self, best_cmap: dict[int, str] | None = None) -> bool:
         """
         Set the width of the non-breaking space glyph to be the same as the space glyph.
 
+        :param best_cmap: The best Unicode character map of the font, as returned by
+            ``CmapTable.best_cmap()``. If ``None``, it is built from the ``cmap`` table.
+        :type best_cmap: Optional[dict[int, str]]
         :raises ValueError: If the space or non-breaking space glyphs do not exist.
         """
-        best_cmap = self.ttfont.getBestCmap()
+        if best_cmap is None:
+            best_cmap = self.ttfont.getBestCmap()
         space_glyph = best_cmap.get(0x0020)
         nbsp_glyph = best_cmap.get(0x00A0)
         if nbsp_glyph is None or space_glyph is None:
@@ -48,8 +52,10 @@ def fix_non_breaking_space_width(self) -> bool:
             raise ValueError(msg)
 
         # Set the width of the non-breaking space glyph
-        if self.table.metrics[nbsp_glyph] != self.table.metrics[space_glyph]:
-            self.table.metrics[nbsp_glyph] = self.table.metrics[space_glyph]
+        metrics = self.table.metrics
+        space_metrics = metrics[space_glyph]
+        if metrics[nbsp_glyph] != space_metrics:
+            metrics[nbsp_glyph] = space_metrics
             return True
 
         return False
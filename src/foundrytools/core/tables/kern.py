@@ -34,26 +34,39 @@ def table(self, value: table__k_e_r_n) -> None:
         """Wrap a new ``table__k_e_r_n`` object."""
         self._table = value
 
-    def remove_unmapped_glyphs(self) -> bool:
-        """Remove unmapped glyphs from the ``kern`` table."""
-        if all(kernTable.format != 0 for kernTable in self.table.kernTables):
+    def remove_unmapped_glyphs(self, character_glyphs: frozenset[str] | None = None) -> bool:
+        """
+        Remove unmapped glyphs from the ``kern`` table.
+
+        :param character_glyphs: The names of the glyphs mapped in the ``cmap`` table, as returned
+            by ``CmapTable.get_mapped_glyph_names()``. If ``None``, they are collected from the
+            ``cmap`` table.
+        :type character_glyphs: Optional[frozenset[str]]
+        :return: ``True`` if any kerning pair was removed, ``False`` otherwise.
+        :rtype: bool
+        """
+        # Only format 0 subtables store glyph pairs.
+        format_0_tables = [kern_table for kern_table in self.table.kernTables if kern_table.format == 0]
+        if not format_0_tables:
             return False
 
-        character_glyphs = set()
-        for table in self.ttfont[T_CMAP].tables:
-            character_glyphs.update(table.cmap.values())
+        if character_glyphs is None:
+            character_glyphs = frozenset(
+                glyph_name for table in self.ttfont[T_CMAP].tables for glyph_name in table.cmap.values()
+            )
 
         modified = False
 
-        for table in self.table.kernTables:
-            if table.format == 0:
-                pairs_to_delete = []
-                for left_glyph, right_glyph in table.kernTable:
-                    if left_glyph not in character_glyphs or right_glyph not in character_glyphs:
-                        pairs_to_delete.append((left_glyph, right_glyph))
-                if pairs_to_delete:
-                    modified = True
-                    for pair in pairs_to_delete:
-                        del table.kernTable[pair]
+        for table in format_0_tables:
+            kern_table = table.kernTable
+            # Filter the pairs in a single pass, instead of deleting them one by one.
+            kept_pairs = {
+                (left, right): value
+                for (left, right), value in kern_table.items()
+                if left in character_glyphs and right in character_glyphs
+            }
+            if len(kept_pairs) != len(kern_table):
+                modified = True
+                table.kernTable = kept_pairs
 
         return modified
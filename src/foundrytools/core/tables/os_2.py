@@ -451,8 +451,8 @@ def vendor_id(self, value: str) -> None:
         :param value: The value to set.
         :type value: str
         """
-        value = value.ljust(4, " ") if len(value) < 4 else value[:4]  # noqa: PLR2004
-        self.table.achVendID = value
+        # Pad with spaces or truncate to exactly 4 characters.
+        self.table.achVendID = f"{value:<4.4}"
 
     @property
     def typo_ascender(self) -> int:
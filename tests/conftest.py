@@ -1 +1,43 @@
 """Test fixtures."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from fontTools.fontBuilder import FontBuilder
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+from foundrytools import Font
+
+if TYPE_CHECKING:
+    from fontTools.ttLib.tables._g_l_y_f import Glyph
+
+
+def _build_glyph(width: int) -> Glyph:
+    pen = TTGlyphPen(None)
+    if width:
+        pen.moveTo((0, 0))
+        pen.lineTo((0, 700))
+        pen.lineTo((width, 700))
+        pen.lineTo((width, 0))
+        pen.closePath()
+    return pen.glyph()
+
+
+@pytest.fixture
+def tt_font() -> Font:
+    """Build a minimal TrueType font with ``.notdef``, ``space``, ``A`` and ``B`` glyphs."""
+    glyph_order = [".notdef", "space", "A", "B"]
+    advance_widths = {".notdef": 500, "space": 250, "A": 600, "B": 600}
+
+    fb = FontBuilder(unitsPerEm=1000, isTTF=True)
+    fb.setupGlyphOrder(glyph_order)
+    fb.setupCharacterMap({0x0020: "space", 0x0041: "A", 0x0042: "B"})
+    fb.setupGlyf({name: _build_glyph(0 if name == "space" else 400) for name in glyph_order})
+    fb.setupHorizontalMetrics({name: (width, 0) for name, width in advance_widths.items()})
+    fb.setupHorizontalHeader(ascent=800, descent=-200)
+    fb.setupNameTable({"familyName": "Test", "styleName": "Regular"})
+    fb.setupOS2()
+    fb.setupPost()
+    return Font(fb.font)
@@ -0,0 +1,34 @@
+"""Tests for the ``cmap`` table wrapper."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from foundrytools import Font
+
+LATIN_CAPITAL_A = 0x0041
+
+
+def test_is_modified_false_when_unchanged(tt_font: Font) -> None:
+    """A wrapper over an untouched table reports no modification."""
+    assert not tt_font.t_cmap.is_modified
+
+
+def test_is_modified_after_ttfont_change(tt_font: Font) -> None:
+    """Changes made through the ``TTFont`` object after the wrapper was created are detected."""
+    cmap = tt_font.t_cmap
+    cmap.get_all_codepoints()
+    for table in tt_font.ttfont["cmap"].tables:
+        table.cmap[0x00A0] = "space"
+    assert cmap.is_modified
+
+
+def test_is_modified_after_remove_glyphs(tt_font: Font) -> None:
+    """Glyphs removed by ``Font.remove_glyphs`` are detected, and dropped from the cached maps."""
+    cmap = tt_font.t_cmap
+    assert cmap.best_cmap()[LATIN_CAPITAL_A] == "A"
+    tt_font.remove_glyphs(glyph_names_to_remove={"A"})
+    assert cmap.is_modified
+    assert LATIN_CAPITAL_A not in cmap.best_cmap()
+    assert "A" not in cmap.get_mapped_glyph_names()